@@ -1,23 +1,43 @@
 import streamlit as st
 import pandas as pd
-from jinja2 import Template
+from jinja2 import Environment, FileSystemLoader
 from datetime import datetime
 import os
+import posixpath
+import re
+import unicodedata
 import base64
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
+from email import encoders
 import traceback
-from io import BytesIO
+import copy
+import hashlib
+import logging
+from io import BytesIO, BufferedReader
 import zipfile
 import numpy as np
 from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
 import requests
 import smtplib
 from email.header import Header
-from email.utils import formataddr
-import shutil
+from email.utils import formataddr, getaddresses
+from email.generator import BytesGenerator
+import time
+import queue
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
+try:
+    import pyarrow  # noqa: F401  (있으면 CSV 파싱에 pyarrow 엔진 사용)
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = 'c'
+
+
+log = logging.getLogger(__name__)
 
 # 페이지 기본 설정
 st.set_page_config(
@@ -41,48 +61,184 @@ def get_smtp_info(email_account):
         return ("smtp.gmail.com", 587)
 
 
+# 본문에서 '.'으로 시작하는 줄 (SMTP DATA 전송 시 이스케이프 필요)
+_DOT_LINE_RE = re.compile(rb'(?m)^\.')
+
+
+class SMTPSession:
+    """SMTP 연결을 한 번만 열고 로그인하여 여러 메일 발송에 재사용합니다."""
+
+    def __init__(self, email_user, email_password, retries=2, backoff=1.0, keepalive_interval=30):
+        self.email_user = email_user
+        self.email_password = email_password
+        self.smtp_server, self.smtp_port = get_smtp_info(email_user)
+        self.retries = retries
+        self.backoff = backoff
+        self.keepalive_interval = keepalive_interval
+        self.server = None
+        self.pipelining = False
+        self._last_used = 0.0
+
+    def __enter__(self):
+        self._connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self._close()
+        return False
+
+    def _connect(self):
+        # 네이버 메일인 경우 SMTP_SSL 사용
+        if "naver.com" in self.email_user.lower():
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+        else:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            server.starttls()
+        server.login(self.email_user, self.email_password)
+        self.server = server
+        self.pipelining = server.has_extn('pipelining')
+        self._last_used = time.monotonic()
+
+    def _close(self):
+        if self.server is None:
+            return
+        try:
+            self.server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self.server = None
+
+    def _ensure_connected(self):
+        """연결이 없거나 한동안 사용하지 않았다면 연결 상태를 확인하고, 끊겼으면 다시 연결합니다."""
+        if self.server is None:
+            # 이전 재연결 시도가 실패한 경우 (다음 메일 발송 시 다시 연결)
+            self._connect()
+            return
+        if time.monotonic() - self._last_used <= self.keepalive_interval:
+            return
+        try:
+            self.server.noop()
+        except smtplib.SMTPServerDisconnected:
+            self._close()
+            self._connect()
+
+    def _send_pipelined(self, msg):
+        """MAIL/RCPT/DATA 명령을 한 번에 보내고 응답을 순서대로 읽습니다. (RFC 2920 PIPELINING)"""
+        server = self.server
+        from_addr = getaddresses([msg['Sender'] or msg['From']])[0][1]
+        addr_fields = [f for f in (msg['To'], msg['Cc'], msg['Bcc']) if f is not None]
+        to_addrs = [addr for _, addr in getaddresses(addr_fields)]
+        
+        # SMTPUTF8이 필요한 주소는 smtplib 기본 경로로 발송
+        if not all(addr.isascii() for addr in [from_addr, *to_addrs]):
+            return server.send_message(msg)
+        
+        # Bcc 헤더는 전송 본문에서 제외
+        msg_copy = copy.copy(msg)
+        del msg_copy['Bcc']
+        del msg_copy['Resent-Bcc']
+        with BytesIO() as buffer:
+            BytesGenerator(buffer, policy=msg.policy.clone(linesep='\r\n')).flatten(msg_copy, linesep='\r\n')
+            payload = buffer.getvalue()
+        
+        commands = [f"MAIL FROM:<{from_addr}>"] + [f"RCPT TO:<{addr}>" for addr in to_addrs] + ["DATA"]
+        server.send("".join(f"{command}\r\n" for command in commands))
+        replies = [server.getreply() for _ in commands]
+        
+        mail_code, mail_resp = replies[0]
+        data_code, data_resp = replies[-1]
+        refused = {
+            addr: reply for addr, reply in zip(to_addrs, replies[1:-1])
+            if reply[0] not in (250, 251)
+        }
+        if mail_code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+        if len(refused) == len(to_addrs):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+        if data_code != 354:
+            server.rset()
+            raise smtplib.SMTPDataError(data_code, data_resp)
+        
+        payload = _DOT_LINE_RE.sub(b'..', payload)
+        if not payload.endswith(b'\r\n'):
+            payload += b'\r\n'
+        server.send(payload + b'.\r\n')
+        code, resp = server.getreply()
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPDataError(code, resp)
+        return refused
+
+    def send(self, msg):
+        """메일을 발송합니다. 일시적 오류(연결 끊김, 4xx)는 재연결 후 재시도합니다."""
+        for attempt in range(self.retries + 1):
+            try:
+                self._ensure_connected()
+                if self.pipelining:
+                    refused = self._send_pipelined(msg)
+                else:
+                    refused = self.server.send_message(msg)
+                self._last_used = time.monotonic()
+                return refused
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as e:
+                transient = (
+                    isinstance(e, smtplib.SMTPServerDisconnected)
+                    or 400 <= e.smtp_code < 500
+                )
+                if not transient or attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * (2 ** attempt))
+                self._close()
+                self._connect()
+
+
+# 크리에이터 ID 정규화용 패턴
+_WS_RE = re.compile(r'\s+')
+_TRANS = str.maketrans({'\u3000': ' ', '\xa0': ' '})  # 전각 공백, 줄바꿈 없는 공백
+
+
 def normalize_creator_id(creator_id):
     """크리에이터 ID를 정규화합니다."""
     if not creator_id or pd.isna(creator_id):
         return ''
     
-    # 문자열로 변환
-    creator_id = str(creator_id)
-    
-    # 앞뒤 공백 제거 (중간 공백은 유지)
-    creator_id = creator_id.strip()
-    
-    # 인코딩 정규화 (모든 유니코드 문자를 NFC로 정규화)
-    try:
-        import unicodedata
-        creator_id = unicodedata.normalize('NFC', creator_id)
-    except Exception as e:
-        print(f"정규화 중 오류 발생: {str(e)}")
-    
-    # 특수 공백 문자 제거 (일반 공백은 유지)
-    creator_id = creator_id.replace('\u3000', ' ')  # 전각 공백
-    creator_id = creator_id.replace('\xa0', ' ')    # 줄바꿈 없는 공백
-    creator_id = creator_id.strip()
+    # NFC 정규화 → 특수 공백 치환 → 앞뒤 공백 제거
+    creator_id = unicodedata.normalize('NFC', str(creator_id)).translate(_TRANS).strip()
     
     # 연속된 공백을 하나의 공백으로 변경
-    import re
-    creator_id = re.sub(r'\s+', ' ', creator_id)
-    
-    return creator_id
+    return _WS_RE.sub(' ', creator_id)
+
+
+def _normalize_id_series(ids):
+    """크리에이터 ID 컬럼 전체를 normalize_creator_id와 같은 규칙으로 정규화합니다."""
+    # pyarrow 문자열(RE2)의 \s는 ASCII 공백만 찾으므로 파이썬 re를 쓰는 python 저장소로 고정
+    return (
+        ids.astype('string[python]')
+        .str.normalize('NFC')
+        .str.replace('\u3000', ' ', regex=False)  # 전각 공백
+        .str.replace('\xa0', ' ', regex=False)    # 줄바꿈 없는 공백
+        .str.strip()
+        .str.replace(r'\s+', ' ', regex=True)
+    )
 
 
 class DataValidator:
     def __init__(self, original_df, creator_info_handler):
         """데이터 검증을 위한 초기화"""
-        self.original_df = original_df.copy()  # 데이터프레임 복사
+        self._df = original_df  # 원본 데이터프레임 (복사/수정하지 않음)
         
         self.summary_row = original_df.iloc[0]  # 2행(인덱스 0)의 합계 데이터
         
-        self.data_rows = original_df.iloc[1:]   # 3행(인덱스 1)부터의 실제 데이터
+        # 아이디 컬럼 정규화 (원본을 수정하지 않고 별도로 보관)
+        self._ids = original_df['아이디'].astype(str).str.strip()
         
-        # 아이디 컬럼 정규화
-        self.data_rows.loc[:, '아이디'] = self.data_rows['아이디'].astype(str).str.strip()
-        self.original_df.loc[:, '아이디'] = self.original_df['아이디'].astype(str).str.strip()
+        # 크리에이터별 합계 (전체 통계와 크리에이터별 통계에서 공용)
+        # 아이디가 빈 행(합계 행 포함)도 전체 합계와 검증에 포함되도록 dropna=False
+        self._grouped = self._df[['조회수', '대략적인 파트너 수익 (KRW)']].groupby(
+            self._ids, sort=False, dropna=False
+        ).sum()
         
         self.creator_info_handler = creator_info_handler
         self.commission_rates = self._get_commission_rates()
@@ -99,22 +255,21 @@ class DataValidator:
 
     def _calculate_total_stats(self):
         """전체 통계를 계산합니다."""
-        creator_revenues = self.original_df.groupby('아이디').agg({
-            '대략적인 파트너 수익 (KRW)': 'sum'
-        })
+        creator_revenues = self._grouped['대략적인 파트너 수익 (KRW)']
         total_revenue_after = sum(
             revenue * self.commission_rates.get(creator_id, 0)
-            for creator_id, revenue in creator_revenues['대략적인 파트너 수익 (KRW)'].items()
+            for creator_id, revenue in creator_revenues.items()
         )
         
+        data_rows = self._df.iloc[1:]  # 3행(인덱스 1)부터의 실제 데이터
         summary_stats = {
-            'creator_count': len(self.original_df['아이디'].unique()),
+            'creator_count': len(self._grouped),
             'total_views_summary': self.summary_row['조회수'],
             'total_revenue_summary': self.summary_row['대략적인 파트너 수익 (KRW)'],
-            'total_views_data': self.original_df['조회수'].sum(),
-            'total_views_data2': self.data_rows['조회수'].sum(),
-            'total_revenue_data': self.original_df['대략적인 파트너 수익 (KRW)'].sum(),
-            'total_revenue_data2': self.data_rows['대략적인 파트너 수익 (KRW)'].sum(),
+            'total_views_data': self._grouped['조회수'].sum(),
+            'total_views_data2': data_rows['조회수'].sum(),
+            'total_revenue_data': creator_revenues.sum(),
+            'total_revenue_data2': data_rows['대략적인 파트너 수익 (KRW)'].sum(),
             'total_revenue_after': total_revenue_after
         }
         return summary_stats
@@ -122,21 +277,16 @@ class DataValidator:
 
     def _calculate_creator_stats(self):
         """크리에이터별 통계를 계산합니다."""
-        grouped = self.original_df.groupby('아이디', as_index=False).agg({
-            '조회수': 'sum',
-            '대략적인 파트너 수익 (KRW)': 'sum'
-        })
-        return grouped
+        creator_stats = self._grouped.reset_index()
+        creator_stats['조회수'] = pd.to_numeric(creator_stats['조회수'], errors='coerce', downcast='integer')
+        return creator_stats
 
     def compare_creator_stats(self, processed_df):
         """크리에이터별 통계를 비교합니다."""
-        processed_df = processed_df.copy()  # 데이터프레임 복사
-        processed_df.loc[:, '아이디'] = processed_df['아이디'].astype(str).str.strip()
-        
-        processed_creator_stats = processed_df.groupby('아이디', as_index=False).agg({
-            '조회수': 'sum',
-            '대략적인 파트너 수익 (KRW)': 'sum'
-        })
+        processed_ids = processed_df['아이디'].astype(str).str.strip()
+        processed_creator_stats = processed_df[['조회수', '대략적인 파트너 수익 (KRW)']].groupby(
+            processed_ids, sort=False
+        ).sum().reset_index()
 
         merged_stats = pd.merge(
             self.creator_stats,
@@ -181,7 +331,7 @@ class CreatorInfoHandler:
         # 데이터 정규화
         self.creator_info = self.creator_info[required_columns].copy()
         self.creator_info['아이디'] = self.creator_info['아이디'].fillna('')
-        self.creator_info['아이디'] = self.creator_info['아이디'].apply(normalize_creator_id)
+        self.creator_info['아이디'] = _normalize_id_series(self.creator_info['아이디'])
         
         # percent 컬럼 처리
         self.creator_info['percent'] = pd.to_numeric(self.creator_info['percent'], errors='coerce')
@@ -193,12 +343,10 @@ class CreatorInfoHandler:
             creator_id = normalize_creator_id(row['아이디'])
             if creator_id:  # 빈 문자열이 아닌 경우만 저장
                 self.commission_rates[creator_id] = float(row['percent'])
-                print(f"수수료율 저장: {creator_id} ({creator_id.encode('utf-8')}) -> {float(row['percent'])}")
+                log.debug("수수료율 저장: %s -> %s", creator_id, self.commission_rates[creator_id])
         
-        # 디버깅용 출력
-        print("\n크리에이터 수수료율 정보 (바이트 표현):")
-        for creator_id, rate in self.commission_rates.items():
-            print(f"- {creator_id} ({creator_id.encode('utf-8')}): {rate}")
+        # 검증 표에 한 번에 병합할 수 있도록 Series로도 보관 (정규화된 아이디 기준)
+        self.rates_series = pd.Series(self.commission_rates, name='수수료율', dtype='float64')
 
     def get_commission_rate(self, creator_id):
         """크리에이터의 수수료율을 반환합니다."""
@@ -240,17 +388,6 @@ class CreatorInfoHandler:
             return []
         return [id for id in self.creator_info['아이디'].unique() if id and not pd.isna(id)]
 
-def clean_numeric_value(value):
-    """숫자 값을 안전하게 정수로 변환합니다."""
-    try:
-        if pd.isna(value):
-            return 0
-        if isinstance(value, str):
-            value = value.replace(',', '')
-        return int(float(value))
-    except (ValueError, TypeError):
-        return 0
-
 
 def show_validation_results(original_df, processed_df, creator_info_handler):
     """검증 결과를 표시합니다."""
@@ -304,9 +441,10 @@ def show_validation_results(original_df, processed_df, creator_info_handler):
     # 크리에이터별 검증
     st.subheader("크리에이터별 검증")
     creator_comparison = validator.compare_creator_stats(processed_df)
-    creator_comparison['수수료율'] = creator_comparison['아이디'].map(
-        lambda x: creator_info_handler.get_commission_rate(x)
-    )
+    # 수수료율 표와 같은 기준으로 정규화한 아이디로 조회 (없으면 1.0)
+    creator_comparison['수수료율'] = _normalize_id_series(creator_comparison['아이디']).map(
+        creator_info_handler.rates_series
+    ).astype('float64').fillna(1.0)
     creator_comparison['수수료 후 수익'] = creator_comparison['대략적인 파트너 수익 (KRW)_processed'] * creator_comparison['수수료율']
     
     # 칼럼 순서 재정렬
@@ -346,192 +484,180 @@ def show_validation_results(original_df, processed_df, creator_info_handler):
 
 def create_video_data(df):
     """데이터프레임에서 비디오 데이터를 추출합니다."""
-    import base64
-    
-    video_data = []
-    for _, row in df.iterrows():
-        try:
-            if pd.isna(row['동영상 제목']):
-                continue
-            
-            # base64로 인코딩했다가 다시 디코딩
-            title = str(row['동영상 제목'])
-            title_bytes = title.encode('utf-8')
-            title_base64 = base64.b64encode(title_bytes)
-            title = base64.b64decode(title_base64).decode('utf-8')
-            
-            video_data.append({
-                'title': title,
-                'views': clean_numeric_value(row['조회수']),
-                'revenue': clean_numeric_value(row['수수료 후 수익'])
-            })
-            
-        except Exception as e:
-            print(f"Error processing title: {str(e)}")
-            video_data.append({
-                'title': '[인코딩 오류]',
-                'views': clean_numeric_value(row['조회수']),
-                'revenue': clean_numeric_value(row['수수료 후 수익'])
-            })
-            
-    return video_data
+    df = df.dropna(subset=['동영상 제목']).copy()
+    df['title'] = df['동영상 제목'].astype(str)
+    df['views'] = pd.to_numeric(df['조회수'], errors='coerce').fillna(0).astype('int64')
+    df['revenue'] = pd.to_numeric(df['수수료 후 수익'], errors='coerce').fillna(0).astype('int64')
+    return df[['title', 'views', 'revenue']].to_dict('records')
+
+
+@st.cache_resource
+def _get_report_template():
+    """보고서 템플릿을 로드하고 컴파일합니다. (Streamlit 재실행과 관계없이 서버 프로세스당 한 번)"""
+    env = Environment(loader=FileSystemLoader('templates'), autoescape=True)
+    env.globals['format_number'] = lambda x, decimals=0: "{:,.{}f}".format(float(x), decimals)
+    return env.get_template('template.html')
 
 
 def generate_html_report(data):
-    """HTML 보고서를 생성합니다."""
-    try:
-        template_path = 'templates/template.html'
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_str = f.read()
-        
-        # 데이터 검증
-        for video in data['videoData']:
-            video['title'] = validate_text(video['title'])
-            # 디버깅용 출력
-            print(f"Processing title: {video['title']}")
-            print(f"Title bytes: {video['title'].encode('utf-8')}")
-        
-        template = Template(template_str)
-        template.globals['format_number'] = lambda x, decimals=0: "{:,.{}f}".format(float(x), decimals)
-        
-        # 디버깅용 출력
-        html_content = template.render(**data)
-        print("Generated HTML sample:", html_content[:1000])
-        
-        return html_content
-        
-    except Exception as e:
-        st.error(f"HTML 생성 실패 ({data['creatorName']}): {str(e)}")
-        st.write(traceback.format_exc())
-        return None
+    """HTML 보고서를 생성합니다. (오류는 호출한 쪽에서 처리)"""
+    return _get_report_template().render(**data)
 
 
 
+# PDF 보고서 공통 CSS
+_CSS_STR = '''
+    @page {
+        size: A4 portrait;
+        margin: 8mm;
+    }
+
+    body {
+        font-family: system-ui, -apple-system, sans-serif;
+        margin: 0;
+        padding: 0;
+        box-sizing: border-box;
+    }
+    
+    /* RTL(Right-to-Left) 텍스트 지원 */
+    [dir="rtl"] { 
+        text-align: right; 
+        font-family: 'Noto Sans Arabic', sans-serif;
+    }
+    
+    .report-container {
+        max-width: 100%;
+        padding: 8px;
+    }
+    .header {
+        margin-bottom: 12px;
+    }
+    .header h1 {
+        font-size: 21px !important;
+        margin-bottom: 6px;
+        line-height: 1.2;
+        font-weight: bold;
+    }
+    .header .period {
+        font-size: 13px;
+        margin: 6px 0;
+    }
+    .header .disclaimer {
+        font-size: 11px;
+        margin: 4px 0;
+        line-height: 1.3;
+    }
+    .stats-grid {
+        max-width: 100%;
+        gap: 10px;
+        margin-bottom: 10px;
+    }
+    .stat-card {
+        padding: 10px;
+    }
+    .stat-card h3 {
+        font-size: 13px;
+        margin-bottom: 4px;
+    }
+    .stat-card .value {
+        font-size: 18px;
+    }
+    .earnings-table {
+        margin-top: 10px;
+        font-size: 0.7em;
+        border-spacing: 0;
+        border-collapse: collapse;
+    }
+    .earnings-table th {
+        font-size: 0.95em;
+        padding: 2px 3px;
+        line-height: 1;
+    }
+    .earnings-table td {
+        padding: 1px 3px;
+        line-height: 1;
+    }
+    .earnings-table tr {
+        height: auto !important;
+        border-bottom: 0.5px solid #e9ecef;
+    }
+    .earnings-table tbody tr {
+        margin: 0 !important;
+        padding: 0 !important;
+    }
+    .earnings-table th,
+    .earnings-table td {
+        margin: 0 !important;
+        vertical-align: middle;
+    }
+'''
+
+@st.cache_resource
+def _get_font_config():
+    """WeasyPrint 폰트 설정을 생성합니다. (서버 프로세스당 한 번)"""
+    return FontConfiguration()
+
+
+@st.cache_resource
+def _get_report_css():
+    """보고서 CSS를 파싱합니다. (크리에이터마다 다시 파싱하지 않도록 서버 프로세스당 한 번)"""
+    return CSS(string=_CSS_STR, font_config=_get_font_config())
+
+
+def _write_pdf(html_content):
+    """HTML 내용을 PDF 바이트로 변환합니다. 실패하면 예외가 그대로 전달됩니다."""
+    # HTML 직접 생성 (외부 리소스 요청 없이)
+    html_doc = HTML(
+        string=html_content,
+        encoding='utf-8',
+        base_url=None  # base_url 명시적으로 None으로 설정
+    )
+    
+    # PDF 생성
+    pdf_buffer = BytesIO()
+    html_doc.write_pdf(
+        target=pdf_buffer,
+        stylesheets=[_get_report_css()],
+        font_config=_get_font_config()
+    )
+    return pdf_buffer.getvalue()
+
+
 def create_pdf_from_html(html_content, creator_id):
     """HTML 내용을 PDF로 변환합니다."""
     try:
-        print(f"[DEBUG] PDF 생성 시작 - 크리에이터: {creator_id}")
-        
-        # 폰트 설정
-        from weasyprint import HTML, CSS
-        from weasyprint.text.fonts import FontConfiguration
-        font_config = FontConfiguration()
-        
-        # HTML 직접 생성 (외부 리소스 요청 없이)
-        html_doc = HTML(
-            string=html_content,
-            encoding='utf-8',
-            base_url=None  # base_url 명시적으로 None으로 설정
-        )
-
-        # CSS 설정
-        css = CSS(string='''
-            @page {
-                size: A4 portrait;
-                margin: 8mm;
-            }
-
-            body {
-                font-family: system-ui, -apple-system, sans-serif;
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-            
-            /* RTL(Right-to-Left) 텍스트 지원 */
-            [dir="rtl"] { 
-                text-align: right; 
-                font-family: 'Noto Sans Arabic', sans-serif;
-            }
-            
-            .report-container {
-                max-width: 100%;
-                padding: 8px;
-            }
-            .header {
-                margin-bottom: 12px;
-            }
-            .header h1 {
-                font-size: 21px !important;
-                margin-bottom: 6px;
-                line-height: 1.2;
-                font-weight: bold;
-            }
-            .header .period {
-                font-size: 13px;
-                margin: 6px 0;
-            }
-            .header .disclaimer {
-                font-size: 11px;
-                margin: 4px 0;
-                line-height: 1.3;
-            }
-            .stats-grid {
-                max-width: 100%;
-                gap: 10px;
-                margin-bottom: 10px;
-            }
-            .stat-card {
-                padding: 10px;
-            }
-            .stat-card h3 {
-                font-size: 13px;
-                margin-bottom: 4px;
-            }
-            .stat-card .value {
-                font-size: 18px;
-            }
-            .earnings-table {
-                margin-top: 10px;
-                font-size: 0.7em;
-                border-spacing: 0;
-                border-collapse: collapse;
-            }
-            .earnings-table th {
-                font-size: 0.95em;
-                padding: 2px 3px;
-                line-height: 1;
-            }
-            .earnings-table td {
-                padding: 1px 3px;
-                line-height: 1;
-            }
-            .earnings-table tr {
-                height: auto !important;
-                border-bottom: 0.5px solid #e9ecef;
-            }
-            .earnings-table tbody tr {
-                margin: 0 !important;
-                padding: 0 !important;
-            }
-            .earnings-table th,
-            .earnings-table td {
-                margin: 0 !important;
-                vertical-align: middle;
-            }
-        ''')
-        
-        # PDF 생성
-        pdf_buffer = BytesIO()
-        html_doc.write_pdf(
-            target=pdf_buffer,
-            stylesheets=[css],
-            font_config=font_config
-        )
-        pdf_buffer.seek(0)
-
-        # PDF 생성 결과 확인
-        pdf_content = pdf_buffer.getvalue()
-        print(f"[DEBUG] PDF 생성 완료 - 크기: {len(pdf_content)} bytes")
-        
+        log.debug("PDF 생성 시작 - 크리에이터: %s", creator_id)
+        pdf_content = _write_pdf(html_content)
+        log.debug("PDF 생성 완료 - 크기: %d bytes", len(pdf_content))
         return pdf_content
         
-    except Exception as e:
-        print(f"[ERROR] PDF 생성 중 오류 발생: {str(e)}")
-        traceback.print_exc()
+    except Exception:
+        log.exception("PDF 생성 중 오류 발생 (%s)", creator_id)
         return None
 
 
+def _render_one(creator_id, report_data):
+    """크리에이터 한 명의 HTML/PDF 보고서를 생성합니다. (프로세스 풀 작업 단위)
+
+    WeasyPrint 객체는 작업 프로세스 안에서 생성되므로 피클링되지 않습니다.
+    작업 프로세스에서는 Streamlit에 출력할 수 없으므로 오류 내용은 문자열로 반환하고,
+    화면 표시는 부모 프로세스에서 처리합니다.
+    """
+    try:
+        html_content = generate_html_report(report_data)
+    except Exception as e:
+        return creator_id, None, None, f"HTML 생성 실패: {str(e)}"
+    
+    # 일시적인 WeasyPrint 오류로 보고서가 누락되지 않도록 한 번 재시도
+    error = None
+    for _ in range(2):
+        try:
+            return creator_id, html_content, _write_pdf(html_content), None
+        except Exception as e:
+            error = f"PDF 생성 실패: {str(e)}"
+    return creator_id, html_content, None, error
+
+
 
 def create_validation_excel(original_df, processed_df, creator_info_handler):
     """검증 결과를 담은 엑셀 파일을 생성합니다."""
@@ -562,13 +688,14 @@ def create_validation_excel(original_df, processed_df, creator_info_handler):
     validation_df = pd.DataFrame(validation_data)
     
     creator_comparison = validator.compare_creator_stats(processed_df)
-    creator_comparison['수수료율'] = creator_comparison['아이디'].map(
-        lambda x: creator_info_handler.get_commission_rate(x)
-    )
+    # 수수료율 표와 같은 기준으로 정규화한 아이디로 조회 (없으면 1.0)
+    creator_comparison['수수료율'] = _normalize_id_series(creator_comparison['아이디']).map(
+        creator_info_handler.rates_series
+    ).astype('float64').fillna(1.0)
     creator_comparison['수수료 후 수익'] = creator_comparison['대략적인 파트너 수익 (KRW)_processed'] * creator_comparison['수수료율']
     
     excel_buffer = BytesIO()
-    with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
+    with pd.ExcelWriter(excel_buffer, engine='xlsxwriter') as writer:
         summary_df.to_excel(writer, sheet_name='전체 데이터 요약', index=False)
         validation_df.to_excel(writer, sheet_name='전체 데이터 검증', index=False)
         creator_comparison.to_excel(writer, sheet_name='크리에이터별 검증', index=False)
@@ -577,61 +704,56 @@ def create_validation_excel(original_df, processed_df, creator_info_handler):
     return excel_buffer.getvalue()
 
 def create_zip_file(reports_data, excel_files, original_df=None, processed_df=None, creator_info_handler=None):
-    """보고서와 엑셀 파일들을 ZIP 파일로 압축합니다."""
+    """보고서와 엑셀 파일들을 ZIP 파일로 압축합니다.
+
+    PDF와 xlsx는 이미 압축된 형식이므로 다시 압축하지 않고 저장만 하며, HTML만 압축합니다.
+    """
     zip_buffer = BytesIO()
     with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        # HTML 보고서 및 PDF 추가
+        # HTML 보고서 및 PDF 추가 (PDF는 process_data에서 이미 생성됨)
         for filename, content in reports_data.items():
+            if filename.endswith('.pdf'):
+                zip_file.writestr(f"reports/pdf/{filename}", content,
+                                  compress_type=zipfile.ZIP_STORED)
+                continue
+            
             # HTML 파일 추가
-            zip_file.writestr(f"reports/html/{filename}", content)
+            zip_file.writestr(f"reports/html/{filename}", content,
+                              compress_type=zipfile.ZIP_DEFLATED, compresslevel=6)
             
-            # PDF 파일 생성 및 추가
-            creator_id = filename.replace('_report.html', '')
-            pdf_content = create_pdf_from_html(content, creator_id)
-            if pdf_content:
-                pdf_filename = filename.replace('.html', '.pdf')
-                zip_file.writestr(f"reports/pdf/{pdf_filename}", pdf_content)
+            # 대응하는 PDF가 없는 경우에만 PDF 생성
+            pdf_filename = filename.replace('.html', '.pdf')
+            if pdf_filename not in reports_data:
+                creator_id = filename.replace('_report.html', '')
+                pdf_content = create_pdf_from_html(content, creator_id)
+                if pdf_content:
+                    zip_file.writestr(f"reports/pdf/{pdf_filename}", pdf_content,
+                                      compress_type=zipfile.ZIP_STORED)
         
         # 엑셀 파일 추가
         for filename, content in excel_files.items():
-            zip_file.writestr(f"excel/{filename}", content)
+            zip_file.writestr(f"excel/{filename}", content, compress_type=zipfile.ZIP_STORED)
             
         # 검증 결과 엑셀 추가
         if all([original_df is not None, processed_df is not None, creator_info_handler is not None]):
             validation_excel = create_validation_excel(original_df, processed_df, creator_info_handler)
-            zip_file.writestr("validation/validation_results.xlsx", validation_excel)
+            zip_file.writestr("validation/validation_results.xlsx", validation_excel,
+                              compress_type=zipfile.ZIP_STORED)
     
     zip_buffer.seek(0)
     return zip_buffer.getvalue()
 
-def validate_text(text):
-    """텍스트 데이터 검증"""
-    if not isinstance(text, str):
-        return str(text)
-    try:
-        # 여러 단계의 인코딩/디코딩 검증
-        validated = text.encode('utf-8').decode('utf-8')
-        return validated
-    except Exception as e:
-        print(f"Text validation error: {str(e)}")
-        return text
-
-
 def process_data(input_df, creator_info_handler, start_date, end_date, 
                 email_user=None, email_password=None,
                 progress_container=None, status_container=None, validation_container=None):
     """데이터를 처리하고 보고서를 생성합니다."""
-    import unicodedata  # 여기에 추가
-
     try:
         # 입력 데이터프레임 처리 부분
         input_df = input_df.copy()
 
-        # 문자열 데이터 인코딩 처리
+        # 문자열 데이터 처리 (파이썬 문자열은 항상 유효한 유니코드이므로 재인코딩 불필요)
         if '동영상 제목' in input_df.columns:
-            input_df['동영상 제목'] = input_df['동영상 제목'].apply(
-                lambda x: x.encode('utf-8').decode('utf-8') if isinstance(x, str) else str(x)
-            )
+            input_df['동영상 제목'] = input_df['동영상 제목'].astype('string')
         
         # NaN 값 처리 및 아이디 정규화
         input_df['아이디'] = input_df['아이디'].fillna('')
@@ -641,38 +763,58 @@ def process_data(input_df, creator_info_handler, start_date, end_date,
         input_df = input_df[input_df['아이디'].apply(lambda x: x != '' and x.lower() != 'nan')]
         
         # 크리에이터 목록 추출
-        input_df['아이디'] = input_df['아이디'].apply(normalize_creator_id)
-        unique_creators = sorted(input_df[input_df['아이디'] != '']['아이디'].unique())
+        input_df['아이디'] = _normalize_id_series(input_df['아이디'])
+        input_df = input_df[input_df['아이디'] != '']
+        unique_creators = sorted(input_df['아이디'].unique())
+        
+        # 이후 groupby가 문자열 해싱 대신 정수 코드를 사용하도록 범주형으로 변환
+        input_df['아이디'] = input_df['아이디'].astype('category')
         
         # 수수료율 정보 정규화하여 저장
         commission_rates = {}
         for creator_id in unique_creators:
             normalized_id = normalize_creator_id(creator_id)
-            print(f"\n크리에이터 ID 매칭 시도: {normalized_id} ({normalized_id.encode('utf-8')})")
-            print("저장된 수수료율 키:", [f"{k} ({k.encode('utf-8')})" for k in creator_info_handler.commission_rates.keys()])
             
             if normalized_id in creator_info_handler.commission_rates:
                 rate = creator_info_handler.commission_rates[normalized_id]
                 commission_rates[normalized_id] = rate
-                print(f"수수료율 매칭 성공: {normalized_id} -> {rate}")
+                log.debug("수수료율 매칭 성공: %s -> %s", normalized_id, rate)
             else:
-                print(f"수수료율 매칭 실패: {normalized_id}")
+                log.debug("수수료율 매칭 실패: %s", normalized_id)
                 commission_rates[normalized_id] = 1.0  # 기본값 설정
         
-        print("\n수수료율 정보 확인:")
-        for creator_id in unique_creators:
-            rate = commission_rates[creator_id]  # 이미 저장된 값 사용
-            print(f"- {creator_id}: {rate}")
-        
         total_creators = len(unique_creators)
         if total_creators == 0:
             st.error("처리할 크리에이터 데이터가 없습니다.")
             return None, None, None
         
+        # 수치 데이터 처리 (조회수는 정수형으로 축소하여 이후 집계의 메모리 사용량 절감)
+        input_df['조회수'] = pd.to_numeric(
+            pd.to_numeric(input_df['조회수'], errors='coerce').fillna(0), downcast='integer'
+        )
+        input_df['대략적인 파트너 수익 (KRW)'] = pd.to_numeric(input_df['대략적인 파트너 수익 (KRW)'], errors='coerce').fillna(0)
+        
+        # 수수료율 적용 (크리에이터별이 아닌 전체 프레임에 한 번에 적용)
+        rates = input_df['아이디'].map(commission_rates).astype('float64').fillna(1.0)
+        input_df['수수료 후 수익'] = input_df['대략적인 파트너 수익 (KRW)'].to_numpy() * rates.to_numpy()
+        
+        # 크리에이터별 통계 (한 번의 groupby로 계산)
+        creator_totals = input_df.groupby('아이디', sort=False, observed=True).agg(
+            total_views=('조회수', 'sum'),
+            total_rev=('대략적인 파트너 수익 (KRW)', 'sum')
+        )
+        
+        # 크리에이터별 조회수 상위 50개 (한 번의 정렬로 전체 크리에이터 처리)
+        top50 = input_df.sort_values(
+            ['아이디', '조회수'], ascending=[True, False], kind='mergesort'
+        ).groupby('아이디', sort=False, observed=True).head(50)
+        top50_grouped = dict(iter(top50.groupby('아이디', sort=False, observed=True)))
+        
         reports_data = {}
         excel_files = {}
-        processed_full_data = pd.DataFrame()
+        processed_chunks = []
         failed_creators = []
+        render_jobs = []
         
         if progress_container:
             progress_bar = progress_container.progress(0)
@@ -680,41 +822,31 @@ def process_data(input_df, creator_info_handler, start_date, end_date,
             progress_status = progress_container.empty()
             failed_status = progress_container.empty()
         
-        for idx, creator_id in enumerate(unique_creators):
+        # 크리에이터별 데이터 분할 (크리에이터마다 전체 프레임을 스캔하지 않도록 한 번만 그룹화)
+        grouped = input_df.groupby('아이디', sort=False, observed=True)
+        
+        for idx, (creator_id, creator_data) in enumerate(grouped):
             try:
                 if progress_container:
                     progress = (idx + 1) / total_creators
                     progress_bar.progress(progress)
                     progress_text.write(f"진행 상황: {idx + 1}/{total_creators} - {creator_id} 처리 중...")
                 
-                # 데이터 필터링 및 처리
-                creator_data = input_df[input_df['아이디'] == creator_id].copy()
-                if creator_data.empty:
-                    failed_creators.append(f"{creator_id} (데이터 없음)")
-                    continue
-                
-                # 수치 데이터 처리
-                creator_data['조회수'] = pd.to_numeric(creator_data['조회수'], errors='coerce').fillna(0)
-                creator_data['대략적인 파트너 수익 (KRW)'] = pd.to_numeric(creator_data['대략적인 파트너 수익 (KRW)'], errors='coerce').fillna(0)
-                
-                # 수수료율 적용 (get_commission_rate 호출하지 않고 직접 사용)
+                # 수수료율 (수수료 후 수익 컬럼은 이미 계산되어 있음)
                 commission_rate = commission_rates[creator_id]
-                print(f"수수료율 적용: {creator_id} -> {commission_rate}")
+                log.debug("수수료율 적용: %s -> %s", creator_id, commission_rate)
                 
-                creator_data['수수료 적용 수익'] = creator_data['대략적인 파트너 수익 (KRW)'] * commission_rate
-                
-                # 통계 계산
-                total_views = int(creator_data['조회수'].sum())
-                total_revenue = int(creator_data['대략적인 파트너 수익 (KRW)'].sum())
+                # 통계 조회
+                totals = creator_totals.loc[creator_id]
+                total_views = int(totals.total_views)
+                total_revenue = int(totals.total_rev)
+                # 정산 금액은 기존과 같이 정수로 자른 총수익에 수수료율을 곱해 계산 (행별 합계와 최대 1원 차이)
                 total_revenue_after = int(total_revenue * commission_rate)
                 
-                processed_full_data = pd.concat([processed_full_data, creator_data])
-                
-                # 수수료 적용 수익 계산
-                creator_data['수수료 후 수익'] = creator_data['대략적인 파트너 수익 (KRW)'] * commission_rate
+                processed_chunks.append(creator_data)
                 
-                # 상위 50개 데이터 필터링 (조회수)
-                filtered_data = creator_data.nlargest(50, '조회수').copy()
+                # 상위 50개 데이터 (조회수)
+                filtered_data = top50_grouped[creator_id]
                 
                 # 총계 행 추가
                 total_row = pd.Series({
@@ -727,7 +859,8 @@ def process_data(input_df, creator_info_handler, start_date, end_date,
                 
                 # 엑셀 파일 생성
                 excel_buffer = BytesIO()
-                filtered_data.to_excel(excel_buffer, index=False)
+                with pd.ExcelWriter(excel_buffer, engine='xlsxwriter') as writer:
+                    filtered_data.to_excel(writer, index=False)
                 excel_buffer.seek(0)
                 excel_files[f"{creator_id}.xlsx"] = excel_buffer.getvalue()
                 
@@ -740,16 +873,7 @@ def process_data(input_df, creator_info_handler, start_date, end_date,
                     'commission_rate': commission_rate,  # 수수료율 추가
                     'videoData': create_video_data(filtered_data)  # 필터링된 데이터 전달
                 }
-                
-                # HTML 보고서 생성
-                html_content = generate_html_report(report_data)
-                if html_content:
-                    reports_data[f"{creator_id}_report.html"] = html_content
-                
-                # PDF 보고서 생성
-                pdf_content = create_pdf_from_html(html_content, creator_id)
-                if pdf_content:
-                    reports_data[f"{creator_id}_report.pdf"] = pdf_content
+                render_jobs.append((creator_id, report_data))
                 
             except Exception as e:
                 failed_creators.append(f"{creator_id} (오류: {str(e)})")
@@ -757,6 +881,53 @@ def process_data(input_df, creator_info_handler, start_date, end_date,
                     status_container.error(f"{creator_id} 처리 중 오류: {str(e)}")
                 continue
         
+        # 처리된 데이터는 루프가 끝난 뒤 한 번에 병합
+        processed_full_data = pd.concat(processed_chunks, ignore_index=True) if processed_chunks else pd.DataFrame()
+        
+        # HTML/PDF 보고서 생성 (크리에이터별로 독립적이므로 프로세스 풀에서 병렬 처리)
+        rendered = {}
+        if render_jobs:
+            # 작업 프로세스는 서버 프로세스를 복제하므로 실제 작업 수와 사용 가능한 CPU 수를 넘지 않도록 제한
+            max_workers = min(len(render_jobs), os.cpu_count() or 1)
+            
+            # 작업 프로세스가 캐시된 템플릿과 CSS를 물려받도록 풀을 만들기 전에 미리 로드
+            _get_report_template()
+            _get_report_css()
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_render_one, creator_id, report_data): creator_id
+                    for creator_id, report_data in render_jobs
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    creator_id = futures[future]
+                    try:
+                        _, html_content, pdf_content, error = future.result()
+                        rendered[creator_id] = (html_content, pdf_content, error)
+                        if error and status_container:
+                            status_container.error(f"{creator_id} 보고서 생성 중 오류: {error}")
+                    except Exception as e:
+                        failed_creators.append(f"{creator_id} (오류: {str(e)})")
+                        if status_container:
+                            status_container.error(f"{creator_id} 보고서 생성 중 오류: {str(e)}")
+                    
+                    if progress_container:
+                        progress_bar.progress(done / len(render_jobs))
+                        progress_text.write(f"보고서 생성: {done}/{len(render_jobs)} - {creator_id} 완료")
+        
+        # 크리에이터 순서대로 결과 저장
+        for creator_id, _ in render_jobs:
+            if creator_id not in rendered:
+                continue
+            html_content, pdf_content, error = rendered[creator_id]
+            if not html_content:
+                failed_creators.append(f"{creator_id} ({error or 'HTML 실패'})")
+                continue
+            reports_data[f"{creator_id}_report.html"] = html_content
+            if pdf_content:
+                reports_data[f"{creator_id}_report.pdf"] = pdf_content
+            else:
+                failed_creators.append(f"{creator_id} ({error or 'PDF 실패'})")
+        
         if failed_creators:
             st.warning(f"처리 실패한 크리에이터들: {', '.join(failed_creators)}")
         
@@ -787,16 +958,6 @@ def process_data(input_df, creator_info_handler, start_date, end_date,
             # 관리자에게 자동으로 이메일 발송
             if email_user and email_password:
                 try:
-                    smtp_server, smtp_port = get_smtp_info(email_user)
-                
-                    # 네이버 메일인 경우 SMTP_SSL 사용
-                    if "naver.com" in email_user.lower():
-                        server = smtplib.SMTP_SSL(smtp_server, smtp_port)
-                    else:
-                        server = smtplib.SMTP(smtp_server, smtp_port)
-                        server.starttls()
-                    server.login(email_user, email_password)
-
                     zip_data = create_zip_file(reports_data, excel_files, input_df, processed_full_data, creator_info_handler)
                     
                     admin_msg = MIMEMultipart()
@@ -811,8 +972,8 @@ def process_data(input_df, creator_info_handler, start_date, end_date,
                     attachment.add_header('Content-Disposition', 'attachment', filename='reports.zip')
                     admin_msg.attach(attachment)
                     
-                    server.send_message(admin_msg)
-                    server.quit()
+                    with SMTPSession(email_user, email_password) as smtp:
+                        smtp.send(admin_msg)
                     
                     if status_container:
                         status_container.success("관리자 이메일로 보고서가 발송되었습니다.")
@@ -829,82 +990,192 @@ def process_data(input_df, creator_info_handler, start_date, end_date,
         st.write(traceback.format_exc())
         return None, None, None
 
+class _StatusThrottle:
+    """Streamlit placeholder 갱신을 일정 간격으로 묶어서 처리합니다. (반복문 안의 잦은 재렌더링 방지)"""
+
+    def __init__(self, placeholder, interval=0.5, max_lines=20):
+        self.placeholder = placeholder
+        self.interval = interval
+        self.max_lines = max_lines
+        self.lines = []
+        self._last_flush = 0.0
+
+    def add(self, line):
+        self.lines.append(line)
+        if time.monotonic() - self._last_flush > self.interval:
+            self.flush()
+
+    def flush(self):
+        if self.lines:
+            self.placeholder.info("  \n".join(self.lines[-self.max_lines:]))
+        self._last_flush = time.monotonic()
+
+
+# 동시에 사용할 최대 SMTP 연결 수 (메일 서버의 동시 접속 제한을 넘지 않도록 작게 유지)
+_SMTP_MAX_CONNECTIONS = 5
+
+
+def _send_messages(email_user, email_password, jobs, build_message, max_connections=_SMTP_MAX_CONNECTIONS):
+    """메시지를 만들면서 동시에 여러 SMTP 연결로 발송합니다.
+
+    생성 스레드가 build_message(*job)로 메시지를 미리 만들어 큐(최대 4건)에 넣고,
+    발송 스레드들은 각자의 SMTPSession으로 큐에서 꺼낸 메시지를 바로 보냅니다.
+    작업 스레드에서는 Streamlit을 호출하지 않으며, 반환값은 (creator_id, 예외 또는 None) 목록입니다.
+    """
+    if not jobs:
+        return []
+    
+    results = []
+    with ExitStack() as stack:
+        # 연결은 미리 열어 둠 (첫 연결부터 실패하면 인증 오류 등이므로 예외를 그대로 전달)
+        sessions = []
+        for _ in range(min(max_connections, len(jobs))):
+            try:
+                sessions.append(stack.enter_context(SMTPSession(email_user, email_password)))
+            except Exception:
+                if not sessions:
+                    raise
+                break
+        
+        pending = queue.Queue(maxsize=4)
+        
+        def _produce():
+            try:
+                for job in jobs:
+                    creator_id = job[0]
+                    try:
+                        pending.put((creator_id, build_message(*job)))
+                    except Exception as e:
+                        results.append((creator_id, e))
+            finally:
+                for _ in sessions:
+                    pending.put(None)
+        
+        def _consume(smtp):
+            while True:
+                item = pending.get()
+                if item is None:
+                    return
+                creator_id, msg = item
+                try:
+                    smtp.send(msg)
+                    results.append((creator_id, None))
+                except Exception as e:
+                    results.append((creator_id, e))
+        
+        with ThreadPoolExecutor(max_workers=len(sessions) + 1) as executor:
+            executor.submit(_produce)
+            for smtp in sessions:
+                executor.submit(_consume, smtp)
+    
+    return results
+
+
+def _encode_pdf(content):
+    """PDF 바이트를 MIME 첨부용 base64 문자열로 인코딩합니다."""
+    return base64.encodebytes(content).decode('ascii')
+
+
 def send_creator_emails(reports_data, creator_info_handler, email_user, email_password, 
                        email_subject_template, email_body_template, cc_addresses=None, bcc_addresses=None):
     """크리에이터들에게 이메일을 발송합니다."""
     failed_creators = []
     
     try:
-        # SMTP 서버 연결
         placeholder = st.empty()
-        placeholder.info("SMTP 서버에 연결 중...")
-
-        # **수정된 부분: 이메일 계정에 따른 SMTP 서버 선택**
-        smtp_server, smtp_port = get_smtp_info(email_user)
         
-        # 네이버 계정이면 SMTP_SSL 사용 (보통 포트 465)
-        if "naver.com" in email_user.lower():
-            # get_smtp_info에서 반환된 포트를 사용
-            server = smtplib.SMTP_SSL(smtp_server, smtp_port)
-        else:
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-
-        placeholder.info("로그인 시도 중...")
-        server.login(email_user, email_password)
-        placeholder.success("SMTP 서버 연결 및 로그인 성공")
-
-        # 크리에이터별 이메일 발송
+        # 크리에이터별 이메일 메시지 생성
         pdf_files = {k: v for k, v in reports_data.items() if k.endswith('_report.pdf')}
         placeholder.info(f"총 {len(pdf_files)}개의 크리에이터 보고서 처리 예정")
         
-        status_placeholder = st.empty()
+        # PDF는 한 번만 base64 인코딩해 두고 첨부 생성 시 재사용 (내용이 같은 PDF는 해시로 공유)
+        encoded_by_digest = {}
+        encoded_pdfs = {}
         for filename, content in pdf_files.items():
-            creator_id = filename.replace('_report.pdf', '')
+            digest = hashlib.sha256(content).digest()
+            if digest not in encoded_by_digest:
+                encoded_by_digest[digest] = _encode_pdf(content)
+            encoded_pdfs[filename] = encoded_by_digest[digest]
+        
+        # 실행 중 변하지 않는 헤더 값은 한 번만 생성
+        from_header = formataddr(("이스트블루", email_user))  # 보내는 사람 이름 설정
+        cc_header = ", ".join(cc_addresses) if cc_addresses else None
+        bcc_header = ", ".join(bcc_addresses) if bcc_addresses else None
+        
+        # 본문에 크리에이터 ID가 없으면 본문 파트를 한 번만 만들어 모든 메일에 재사용
+        static_body = None
+        if '{creator_id' not in email_body_template:
             try:
-                email = creator_info_handler.get_email(creator_id)
-                if not email:
-                    status_placeholder.warning(f"{creator_id}: 이메일 주소 없음")
-                    failed_creators.append(creator_id)
-                    continue
-                
-                status_placeholder.info(f"{creator_id}: 이메일 발송 준비 중 ({email})")
-                
-                # 이메일 메시지 생성
-                msg = MIMEMultipart()
-                msg["From"] = formataddr(("이스트블루", email_user))  # 보내는 사람 이름 설정
-                msg["To"] = email
-                msg["Subject"] = Header(email_subject_template.format(creator_id=creator_id), 'utf-8')  # 제목 인코딩
-                
-                # (추가) CC 설정
-                # cc_addresses가 있다면 "," 로 join
-                if cc_addresses:
-                    msg["Cc"] = ", ".join(cc_addresses)
-
-                # (추가) BCC 설정
-                if bcc_addresses:
-                    msg["Bcc"] = ", ".join(bcc_addresses)
-
-                # 템플릿에 크리에이터 ID 적용
+                static_body = MIMEText(email_body_template.format(creator_id=''), "plain", 'utf-8')
+            except (KeyError, IndexError, ValueError) as e:
+                # 짝이 맞지 않는 중괄호나 알 수 없는 {필드}는 SMTP 오류가 아니라 템플릿 오류로 표시
+                placeholder.error(f"이메일 본문 템플릿 오류 ({{creator_id}} 외의 중괄호 확인 필요): {str(e)}")
+                return list(creator_info_handler.get_all_creator_ids())
+        
+        def build_message(creator_id, email, filename):
+            """크리에이터 한 명의 이메일 메시지를 만듭니다. (발송과 병행하여 작업 스레드에서 실행)"""
+            msg = MIMEMultipart()
+            msg["From"] = from_header
+            msg["To"] = email
+            subject = email_subject_template.format(creator_id=creator_id)
+            msg["Subject"] = subject if subject.isascii() else Header(subject, 'utf-8')  # 한글 제목만 인코딩
+            
+            # (추가) CC / BCC 설정
+            if cc_header:
+                msg["Cc"] = cc_header
+            if bcc_header:
+                msg["Bcc"] = bcc_header
+
+            # 템플릿에 크리에이터 ID 적용
+            if static_body is not None:
+                msg.attach(static_body)
+            else:
                 body = email_body_template.format(creator_id=creator_id)
                 msg.attach(MIMEText(body, "plain", 'utf-8'))  # 본문 인코딩
-                
-                # PDF 첨부
-                attachment = MIMEApplication(content, _subtype="pdf")
-                attachment.add_header('Content-Disposition', 'attachment', 
-                                   filename=('utf-8', '', f"{creator_id}_report.pdf"))  # 파일명 인코딩
-                msg.attach(attachment)
-                
-                # 이메일 발송
-                status_placeholder.info(f"{creator_id}: 이메일 발송 시도 중...")
-                server.send_message(msg)
-                status_placeholder.success(f"{creator_id}: 이메일 발송 성공")
-                
-            except Exception as e:
-                status_placeholder.error(f"{creator_id}: 이메일 발송 실패 - {str(e)}")
+            
+            # PDF 첨부 (미리 인코딩한 payload 사용)
+            attachment = MIMEApplication(encoded_pdfs[filename], _subtype="pdf", _encoder=encoders.encode_noop)
+            attachment['Content-Transfer-Encoding'] = 'base64'
+            pdf_filename = f"{creator_id}_report.pdf"
+            attachment.add_header('Content-Disposition', 'attachment', 
+                               filename=pdf_filename if pdf_filename.isascii() else ('utf-8', '', pdf_filename))  # 한글 파일명만 인코딩
+            msg.attach(attachment)
+            return msg
+        
+        # 수신자 확인 (Streamlit 호출이 있으므로 메인 스레드에서 처리)
+        status_placeholder = st.empty()
+        issue_placeholder = st.empty()
+        status = _StatusThrottle(status_placeholder)
+        issues = []  # 경고/오류는 모아서 한 번에 표시
+        jobs = []
+        for filename in pdf_files:
+            creator_id = filename.replace('_report.pdf', '')
+            email = creator_info_handler.get_email(creator_id)
+            if not email:
+                issues.append(f"{creator_id}: 이메일 주소 없음")
+                failed_creators.append(creator_id)
+                continue
+            
+            status.add(f"{creator_id}: 이메일 발송 준비 중 ({email})")
+            jobs.append((creator_id, email, filename))
+        status.flush()
+        
+        # 메시지 생성과 발송을 겹쳐서 여러 SMTP 연결로 동시에 처리 (화면 갱신은 완료 후 한 번에 처리)
+        placeholder.info(f"SMTP 서버에 연결하여 {len(jobs)}건 발송 중...")
+        results = _send_messages(email_user, email_password, jobs, build_message)
+        
+        sent_count = 0
+        for creator_id, error in results:
+            if error is None:
+                sent_count += 1
+            else:
+                issues.append(f"{creator_id}: 이메일 발송 실패 - {str(error)}")
                 failed_creators.append(creator_id)
         
-        server.quit()
+        if sent_count:
+            status_placeholder.success(f"{sent_count}건 이메일 발송 성공")
+        if issues:
+            issue_placeholder.warning("  \n".join(issues))
         placeholder.success("SMTP 서버 연결 종료")
         
     except Exception as e:
@@ -915,6 +1186,10 @@ def send_creator_emails(reports_data, creator_info_handler, email_user, email_pa
 
 
 
+# ZIP 파일명의 데이터 기간 패턴 (YYYY-MM-DD_YYYY-MM-DD 형식)
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}_\d{4}-\d{2}-\d{2}')
+
+
 def extract_creator_name(zip_filename):
     """압축파일명에서 크리에이터명 추출"""
     try:
@@ -922,9 +1197,7 @@ def extract_creator_name(zip_filename):
         filename_without_ext = zip_filename.replace('.zip', '')
         
         # 날짜 패턴 찾기 (YYYY-MM-DD_YYYY-MM-DD 형식)
-        import re
-        date_pattern = r'\d{4}-\d{2}-\d{2}_\d{4}-\d{2}-\d{2}'
-        match = re.search(date_pattern, filename_without_ext)
+        match = _DATE_RE.search(filename_without_ext)
         
         if match:
             # 날짜 패턴이 끝나는 위치 찾기
@@ -938,84 +1211,112 @@ def extract_creator_name(zip_filename):
         st.error(f"크리에이터명 추출 중 오류: {str(e)}")
         return None
 
+# 원하는 칼럼 순서 정의
+_ZIP_COLUMN_ORDER = [
+    '아이디',
+    '콘텐츠',
+    '동영상 제목',
+    '동영상 게시 시간',
+    '길이',
+    '조회수',
+    '시청 시간(단위: 시간)',
+    '구독자',
+    '대략적인 파트너 수익 (KRW)',
+    '평균 시청 지속 시간'
+]
+
+
+def _read_stats_csv(csv_file):
+    """ZIP 안의 통계 CSV를 읽습니다. pyarrow가 있으면 pyarrow 엔진을 사용합니다."""
+    if _CSV_ENGINE == 'pyarrow':
+        return pd.read_csv(csv_file, encoding='utf-8', engine='pyarrow')
+    
+    # C 엔진: 필요한 칼럼만 파싱 (없는 칼럼이 있어도 오류가 나지 않도록 callable 사용)
+    return pd.read_csv(
+        csv_file,
+        encoding='utf-8',
+        engine='c',
+        low_memory=False,
+        usecols=lambda col: col in _ZIP_COLUMN_ORDER
+    )
+
+
+def _read_zip_file(uploaded_file):
+    """ZIP 파일 하나에서 합계 행과 데이터 행을 읽습니다. (스레드 풀 작업 단위)
+
+    작업 스레드에서는 Streamlit을 호출할 수 없으므로 표시할 메시지는 (레벨, 내용) 목록으로 반환합니다.
+    """
+    messages = []
+    try:
+        # 크리에이터명 추출
+        creator_name = extract_creator_name(uploaded_file.name.replace('.zip', ''))
+        if not creator_name:
+            messages.append(('warning', f"'{uploaded_file.name}' 파일에서 크리에이터명을 추출할 수 없습니다."))
+            return None, messages
+        
+        # 압축을 풀지 않고 ZIP 안의 '표 데이터.csv'를 직접 읽기
+        # 업로드 파일은 이미 메모리에 있는 파일 객체이므로 복사하지 않고 바로 연다
+        with zipfile.ZipFile(uploaded_file) as zip_ref:
+            # 파일명이 정확히 일치하는 항목만 사용 (macOS가 추가하는 __MACOSX/._표 데이터.csv 등은 제외)
+            csv_name = next(
+                (name for name in zip_ref.namelist()
+                 if posixpath.basename(name) == '표 데이터.csv' and not name.startswith('__MACOSX/')),
+                None
+            )
+            if not csv_name:
+                messages.append(('warning', f"'{uploaded_file.name}'에서 '표 데이터.csv' 파일을 찾을 수 없습니다."))
+                return None, messages
+            
+            # CSV 파일 읽기 (256KB 버퍼로 압축 해제 스트림을 크게 읽음)
+            with BufferedReader(zip_ref.open(csv_name), buffer_size=1 << 18) as csv_file:
+                df = _read_stats_csv(csv_file)
+        
+        # '상위 500개 결과 표시' 행 제거 (해당 행이 없으면 인덱싱 생략)
+        mask = df['콘텐츠'].to_numpy() != '상위 500개 결과 표시'
+        if not mask.all():
+            df = df.iloc[mask]
+        
+        # 합계 행과 데이터 행 분리 ('아이디' 칼럼에 크리에이터명 입력, 칼럼 순서는 마지막에 정렬)
+        sum_row = df.iloc[0]
+        data_rows = df.iloc[1:].assign(**{'아이디': creator_name})
+        
+        # 합계 행에도 '아이디' 칼럼 추가
+        if '아이디' not in sum_row.index:
+            sum_row = pd.Series({'아이디': '', **sum_row.to_dict()})
+        
+        messages.append(('success', f"'{uploaded_file.name}' 처리 완료"))
+        return (sum_row, data_rows), messages
+    
+    except Exception as e:
+        messages.append(('error', f"ZIP 파일 처리 중 오류 발생 ({uploaded_file.name}): {str(e)}"))
+        return None, messages
+
+
 def process_zip_files(uploaded_files):
     """여러 ZIP 파일을 처리하여 하나의 통합된 DataFrame으로 반환"""
-    temp_dir = "temp_extract"
     all_data_rows = []  # 실제 데이터 행
     sum_rows = []       # 각 파일의 합계 행
     
-    # 원하는 칼럼 순서 정의
-    column_order = [
-        '아이디',
-        '콘텐츠',
-        '동영상 제목',
-        '동영상 게시 시간',
-        '길이',
-        '조회수',
-        '시청 시간(단위: 시간)',
-        '구독자',
-        '대략적인 파트너 수익 (KRW)',
-        '평균 시청 지속 시간'
-    ]
+    column_order = _ZIP_COLUMN_ORDER
     
     try:
-        os.makedirs(temp_dir, exist_ok=True)
+        # 여러 ZIP 파일을 동시에 처리 (압축 해제와 CSV 파싱은 GIL을 해제함)
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(uploaded_files)))) as executor:
+            results = list(executor.map(_read_zip_file, uploaded_files))
         
-        for uploaded_file in uploaded_files:
-            try:
-                # 임시 파일로 ZIP 저장
-                zip_path = os.path.join(temp_dir, uploaded_file.name)
-                with open(zip_path, 'wb') as f:
-                    f.write(uploaded_file.getvalue())
-                
-                # 크리에이터명 추출
-                creator_name = extract_creator_name(uploaded_file.name.replace('.zip', ''))
-                if not creator_name:
-                    st.warning(f"'{uploaded_file.name}' 파일에서 크리에이터명을 추출할 수 없습니다.")
-                    continue
-                
-                # 압축 해제
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-                
-                # '표 데이터.csv' 파일 찾기
-                csv_file = None
-                for root, dirs, files in os.walk(temp_dir):
-                    if '표 데이터.csv' in files:
-                        csv_file = os.path.join(root, '표 데이터.csv')
-                        break
-                
-                if not csv_file:
-                    st.warning(f"'{uploaded_file.name}'에서 '표 데이터.csv' 파일을 찾을 수 없습니다.")
-                    continue
-                
-                # CSV 파일 읽기
-                df = pd.read_csv(csv_file, encoding='utf-8')
-                
-                # '상위 500개 결과 표시' 행 제거
-                df = df[df['콘텐츠'] != '상위 500개 결과 표시']
-                
-                # 합계 행과 데이터 행 분리
-                sum_row = df.iloc[0].copy()
-                data_rows = df.iloc[1:].copy()
-                
-                # '아이디' 칼럼 추가 및 크리에이터명 입력
-                if '아이디' not in data_rows.columns:
-                    data_rows.insert(0, '아이디', '')  # 첫 번째 위치에 추가
-                data_rows['아이디'] = creator_name
-                
-                # 합계 행에도 '아이디' 칼럼 추가
-                if '아이디' not in sum_row.index:
-                    sum_row = pd.concat([pd.Series({'아이디': ''}), sum_row])
-                
-                # 합계 행과 데이터 행 저장
+        # 결과 저장은 메인 스레드에서 처리하고, 메시지는 종류별로 모아서 한 번씩만 표시
+        grouped_messages = {'success': [], 'warning': [], 'error': []}
+        for result, messages in results:
+            for level, message in messages:
+                grouped_messages[level].append(message)
+            if result is not None:
+                sum_row, data_rows = result
                 sum_rows.append(sum_row)
                 all_data_rows.append(data_rows)
-                
-                st.success(f"'{uploaded_file.name}' 처리 완료")
-            
-            except Exception as e:
-                st.error(f"ZIP 파일 처리 중 오류 발생 ({uploaded_file.name}): {str(e)}")
+        
+        for level, level_messages in grouped_messages.items():
+            if level_messages:
+                getattr(st, level)("  \n".join(level_messages))
         
         if not all_data_rows:
             return None
@@ -1031,10 +1332,15 @@ def process_zip_files(uploaded_files):
         final_sum_row['콘텐츠'] = '합계'
         final_sum_row['아이디'] = ''
         
-        # 모든 합계 행의 숫자형 데이터 합산
-        for col in numeric_cols:
-            if col in final_sum_row.index:
-                final_sum_row[col] = sum(row[col] for row in sum_rows)
+        # 모든 합계 행의 숫자형 데이터 합산 (한 번의 벡터 연산)
+        sums_df = pd.DataFrame(sum_rows)
+        sum_cols = [col for col in numeric_cols if col in final_sum_row.index]
+        # 쉼표가 포함된 숫자나 빈 값 때문에 object로 읽힌 칼럼도 한 번에 숫자로 변환
+        sums_df[sum_cols] = sums_df[sum_cols].apply(
+            lambda col: pd.to_numeric(col.astype(str).str.replace(',', '', regex=False), errors='coerce')
+        ).fillna(0)
+        totals = sums_df[sum_cols].sum(axis=0)
+        final_sum_row.update(totals)
         
         # 합계 행을 DataFrame으로 변환
         sum_row_df = pd.DataFrame([final_sum_row])
@@ -1051,11 +1357,6 @@ def process_zip_files(uploaded_files):
     except Exception as e:
         st.error(f"전체 처리 중 오류 발생: {str(e)}")
         return None
-    
-    finally:
-        # 임시 디렉토리 정리
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
 
 
 